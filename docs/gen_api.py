@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved. SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# Regenerate the Exhale-generated ./api RST tree (and the Doxygen XML it is
+# built from) without producing HTML. Normal doc builds reuse the committed
+# or cached ./api tree; run this after changing parrot.hpp, or let CI run it
+# on a cache miss.
+
+import os
+import subprocess
+import sys
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    env = dict(os.environ, PARROT_REGEN_API="1")
+    # The dummy builder runs the full read phase (which is where Exhale and
+    # Doxygen execute) but skips writing any output.
+    result = subprocess.run(
+        ["sphinx-build", "-b", "dummy", ".", "_build/dummy"],
+        cwd=DOCS_DIR,
+        env=env,
+    )
+    if result.returncode == 0:
+        print("API tree regenerated in docs/api/ (XML in docs/doxyoutput/)")
+    return result.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,13 +17,78 @@
 #
 
 import argparse
+import asyncio
+import hashlib
+import json
 import os
 import re
 import requests
 import sys
-import tempfile
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:
+    # Fall back to threaded fetches over the shared requests session
+    aiohttp = None
+
+# Shared HTTP session: every fetch goes to raw.githubusercontent.com or
+# api.github.com, so keep-alive pooling avoids a fresh TCP+TLS handshake per
+# request. A GITHUB_TOKEN in the environment lifts the API rate limit.
+# Transient 5xx and 429 responses are retried with exponential backoff
+# (honoring Retry-After) instead of aborting the whole run.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4,
+                                  pool_maxsize=32,
+                                  max_retries=_RETRY))
+_SESSION.headers.update({"User-Agent": "parrot-docs-gen"})
+if os.environ.get("GITHUB_TOKEN"):
+    _SESSION.headers["Authorization"] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+
+# Cap on in-flight requests during the concurrent fetch phase
+_FETCH_CONCURRENCY = 64
+
+# In-run memo of fetched bodies, keyed by URL (see fetch_many)
+_FETCHED_BODIES = {}
+
+# On-disk HTTP cache. Responses are stored with their ETag and revalidated
+# with If-None-Match on later runs; a 304 reuses the cached body, so a
+# no-change rerun downloads nothing and barely touches the API rate limit.
+_HTTP_CACHE_DIR = Path(".cache/parrot_docs_http")
+
+
+def _cache_path(url):
+    return _HTTP_CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+
+
+def _cache_load(url):
+    """Return (etag, body) for a cached URL, or (None, None)."""
+    try:
+        etag, _, body = _cache_path(url).read_text(
+            encoding="utf-8").partition("\n")
+        return (etag or None), body
+    except OSError:
+        return None, None
+
+
+def _cache_store(url, etag, body):
+    if not etag:
+        return
+    _HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _cache_path(url).write_text(f"{etag}\n{body}", encoding="utf-8")
 
 # Configuration
 THRUST_EXAMPLES_URL = "https://github.com/NVIDIA/cccl/tree/main/thrust/examples"
@@ -42,16 +107,42 @@ EXAMPLES_OUTPUT_FILE = "docs/examples.rst"
 # // to {end_line}
 
 
+def _respect_rate_limit(headers):
+    """Sleep out the GitHub API rate-limit window when nearly exhausted.
+
+    Retrying into an exhausted window just burns the backoff budget; waiting
+    for the advertised reset keeps later API calls from failing outright.
+    """
+    try:
+        remaining = int(headers.get("X-RateLimit-Remaining", ""))
+        reset = int(headers.get("X-RateLimit-Reset", ""))
+    except (TypeError, ValueError):
+        return
+    if remaining < 5:
+        wait = max(0, reset - time.time()) + 1
+        print(f"GitHub API rate limit nearly exhausted; "
+              f"waiting {wait:.0f}s for reset...")
+        time.sleep(wait)
+
+
 def get_examples_list(api_url):
     """Fetch list of example files from a GitHub repository."""
     try:
-        response = requests.get(api_url)
-        if response.status_code != 200:
+        etag, cached_body = _cache_load(api_url)
+        headers = {"If-None-Match": etag} if etag else {}
+        response = _SESSION.get(api_url, timeout=30, headers=headers)
+        _respect_rate_limit(response.headers)
+        if response.status_code == 304:
+            body = cached_body
+        elif response.status_code == 200:
+            body = response.text
+            _cache_store(api_url, response.headers.get("ETag"), body)
+        else:
             print(f"Error fetching examples: {response.status_code}")
             return []
 
         examples = []
-        for item in response.json():
+        for item in json.loads(body):
             if (item["type"] == "file" and item["name"].endswith(".cu")
                     and not item["name"].startswith("_")):
                 examples.append(item["name"][:-3])  # Remove .cu extension
@@ -61,36 +152,64 @@ def get_examples_list(api_url):
         return []
 
 
-def format_code_with_clang(code):
-    """Format code using clang-format and the project's .clang-format file."""
-    if not code:
-        return None
-
-    # Check if clang-format is available
+def _probe_clang_format():
+    """Check once whether clang-format is available on PATH."""
     try:
         subprocess.run(["clang-format", "--version"],
                        capture_output=True,
                        check=True)
+        return True
     except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+# Probed once at import; format_code_with_clang previously spawned a
+# --version subprocess per call, doubling the process count.
+_CLANG_FORMAT_OK = _probe_clang_format()
+
+# On-disk memo of clang-format results, keyed by the input's content hash
+# plus the hash of the active .clang-format file (so a style change
+# invalidates every entry). Unchanged inputs across runs then cost a small
+# file read instead of a subprocess spawn.
+_CLANG_FORMAT_CACHE_DIR = Path(".cache/clang_format")
+if _CLANG_FORMAT_OK:
+    _CLANG_FORMAT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+try:
+    _STYLE_HASH = hashlib.sha1(Path(".clang-format").read_bytes()).hexdigest()
+except OSError:
+    _STYLE_HASH = ""
+
+
+def format_code_with_clang(code):
+    """Format code using clang-format and the project's .clang-format file."""
+    if not code:
+        return None
+
+    if not _CLANG_FORMAT_OK:
         # clang-format not available, return original code
         return code
 
+    cache_path = _CLANG_FORMAT_CACHE_DIR / (
+        hashlib.sha1(code.encode()).hexdigest() + _STYLE_HASH)
     try:
-        with tempfile.NamedTemporaryFile(suffix=".cu", mode="w+") as tmp_file:
-            # Write the unformatted code to the temporary file
-            tmp_file.write(code)
-            tmp_file.flush()
-
-            # Run clang-format on the temporary file
-            result = subprocess.run(
-                ["clang-format", tmp_file.name],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    try:
+        # Pipe the code through stdin; -assume-filename selects the .cu style
+        # without a temporary file round-trip per snippet
+        result = subprocess.run(
+            ["clang-format", "-assume-filename=example.cu"],
+            input=code,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
 
-            # Return the formatted code
-            return result.stdout
+        # Memoize and return the formatted code
+        cache_path.write_text(result.stdout, encoding="utf-8")
+        return result.stdout
     except subprocess.CalledProcessError as e:
         print(f"Error running clang-format: {e}")
         return code  # Return original code if formatting fails
@@ -99,34 +218,114 @@ def format_code_with_clang(code):
         return code
 
 
-def fetch_example_content(raw_url, example_name):
-    """Fetch the content of an example from GitHub."""
-    url = f"{raw_url}/{example_name}.cu"
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.text
-        print(f"Failed to fetch {url}, status code: {response.status_code}")
-        return None
-    except Exception as e:
-        print(f"Error fetching example: {e}")
-        return None
+def raw_github_url(owner, repo, branch, file_path):
+    """Build the raw.githubusercontent.com URL for a repository file."""
+    return f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{file_path}"
 
 
-def fetch_file_from_github(owner, repo, branch, file_path):
-    """Fetch a file from a GitHub repository."""
-    url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{file_path}"
-    try:
-        print(f"Fetching from: {url}")
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.text
-        print(f"Failed to fetch {url}, status code: {response.status_code}")
+async def _fetch_one_async(session, url, sem):
+    """Fetch a single URL under the concurrency semaphore.
+
+    Mirrors the Retry policy mounted on _SESSION: transient 429/5xx
+    responses are retried with exponential backoff, honoring Retry-After,
+    instead of silently dropping the file from the generated docs.
+    """
+    etag, cached_body = _cache_load(url)
+    headers = {"If-None-Match": etag} if etag else {}
+    async with sem:
+        for attempt in range(5):
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return cached_body
+                    if response.status == 200:
+                        body = await response.text()
+                        _cache_store(url, response.headers.get("ETag"), body)
+                        return body
+                    if response.status in (429, 500, 502, 503, 504):
+                        try:
+                            wait = float(response.headers["Retry-After"])
+                        except (KeyError, ValueError):
+                            wait = 0.5 * 2**attempt
+                        print(f"Retrying {url} after {response.status} "
+                              f"(waiting {wait:.1f}s)")
+                        await asyncio.sleep(wait)
+                        continue
+                    print(f"Failed to fetch {url}, status code: "
+                          f"{response.status}")
+                    return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Connection resets and timeouts are the commonest transient
+                # failures; back off and retry them like a 5xx.
+                if attempt == 4:
+                    print(f"Error fetching {url}: {e}")
+                    return None
+                wait = 0.5 * 2**attempt
+                print(f"Retrying {url} after error: {e} "
+                      f"(waiting {wait:.1f}s)")
+                await asyncio.sleep(wait)
+            except Exception as e:
+                print(f"Error fetching {url}: {e}")
+                return None
+        print(f"Failed to fetch {url}: retries exhausted")
         return None
-    except Exception as e:
-        print(f"Error fetching file from GitHub: {e}")
+
+
+async def _fetch_all_async(urls):
+    sem = asyncio.Semaphore(_FETCH_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit_per_host=_FETCH_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector,
+                                     timeout=timeout,
+                                     headers=dict(_SESSION.headers)) as session:
+        results = await asyncio.gather(
+            *(_fetch_one_async(session, url, sem) for url in urls))
+    return dict(zip(urls, results))
+
+
+def fetch_many(urls):
+    """
+    Fetch many URLs concurrently and return {url: text or None}.
+
+    The fetch phase is pure I/O against two GitHub hosts, so overlapping the
+    requests collapses total wall time from one round trip per file to
+    roughly one round trip overall. Uses aiohttp when available, otherwise
+    threads over the shared requests session.
+    """
+    urls = list(dict.fromkeys(urls))  # Deduplicate, keep order
+    # Each unique URL is requested at most once per run, even when several
+    # examples (or several processing phases) reference the same upstream
+    # file at the same commit.
+    missing = [url for url in urls if url not in _FETCHED_BODIES]
+    if missing:
+        _FETCHED_BODIES.update(_fetch_missing(missing))
+    return {url: _FETCHED_BODIES[url] for url in urls}
+
+
+def _fetch_missing(urls):
+    if aiohttp is not None:
+        return asyncio.run(_fetch_all_async(urls))
+
+    def fetch_one(url):
+        etag, cached_body = _cache_load(url)
+        headers = {"If-None-Match": etag} if etag else {}
+        try:
+            response = _SESSION.get(url, timeout=30, headers=headers)
+            if response.status_code == 304:
+                return cached_body
+            if response.status_code == 200:
+                _cache_store(url, response.headers.get("ETag"), response.text)
+                return response.text
+            print(f"Failed to fetch {url}, status code: "
+                  f"{response.status_code}")
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
         return None
 
+    with ThreadPoolExecutor(max_workers=min(_FETCH_CONCURRENCY,
+                                            len(urls))) as executor:
+        return dict(zip(urls, executor.map(fetch_one, urls)))
+
 
 def parse_github_url_from_comments(code):
     """
@@ -134,11 +333,14 @@ def parse_github_url_from_comments(code):
     Expected format:
     // https://github.com/{owner}/{repo}/blob/{commit}/{path}#L{start_line}
     // to {end_line}
-    
+
     Returns a dict with: url, owner, repo, commit, path, start_line, end_line
     """
-    lines = code.split('\n')
+    return parse_github_url_from_lines(code.split('\n'))
+
 
+def parse_github_url_from_lines(lines):
+    """Like parse_github_url_from_comments, for an already-split line list."""
     for i, line in enumerate(lines):
         line = line.strip()
         if line.startswith('//') and 'github.com' in line:
@@ -193,27 +395,37 @@ def parse_github_url_from_comments(code):
 
 
 def extract_lines_from_code(code, start_line, end_line=None):
-    """Extract specific lines from code (1-indexed)."""
-    if not code:
-        return None
+    """Extract specific lines from code (1-indexed).
 
-    lines = code.split('\n')
+    Walks newline offsets with str.find and slices the original string, so
+    a 20-line extraction from a large source never materializes a list of
+    every line.
+    """
+    if not code or start_line < 1:
+        return None
 
-    # Convert to 0-indexed
-    start_idx = start_line - 1
+    # Find the offset where line start_line begins
+    off = 0
+    for _ in range(start_line - 1):
+        nxt = code.find('\n', off)
+        if nxt < 0:
+            return None
+        off = nxt + 1
 
     if end_line is None:
         # Just get the single line
-        if 0 <= start_idx < len(lines):
-            return lines[start_idx]
-        return None
+        eol = code.find('\n', off)
+        return code[off:eol] if eol >= 0 else code[off:]
 
-    # Get range of lines
-    end_idx = end_line
-    if 0 <= start_idx < len(lines):
-        return '\n'.join(lines[start_idx:end_idx])
-
-    return None
+    # Advance past the requested range, then slice it out in one piece
+    end_off = off
+    for _ in range(end_line - start_line + 1):
+        nxt = code.find('\n', end_off)
+        if nxt < 0:
+            end_off = len(code)
+            break
+        end_off = nxt + 1
+    return code[off:end_off].rstrip('\n')
 
 
 def extract_function_from_code(code, function_name):
@@ -257,33 +469,24 @@ def extract_function_from_code(code, function_name):
                 in_function = True
                 function_started = True
 
-                # Count parentheses and braces
-                for ch in line:
-                    if ch == '(':
-                        paren_count += 1
-                    elif ch == ')':
-                        paren_count -= 1
-                    elif ch == '{':
-                        brace_count += 1
-                        found_opening_brace = True
-                    elif ch == '}':
-                        brace_count -= 1
+                # Count parentheses and braces (C-level scans; only the
+                # totals matter, never per-character positions)
+                paren_count += line.count('(') - line.count(')')
+                opens = line.count('{')
+                brace_count += opens - line.count('}')
+                if opens:
+                    found_opening_brace = True
                 continue
 
         if in_function:
             result_lines.append(line)
 
             # Count parentheses and braces
-            for ch in line:
-                if ch == '(':
-                    paren_count += 1
-                elif ch == ')':
-                    paren_count -= 1
-                elif ch == '{':
-                    brace_count += 1
-                    found_opening_brace = True
-                elif ch == '}':
-                    brace_count -= 1
+            paren_count += line.count('(') - line.count(')')
+            opens = line.count('{')
+            brace_count += opens - line.count('}')
+            if opens:
+                found_opening_brace = True
 
             # Check if we've reached the end
             # For function declarations (no braces), stop at semicolon
@@ -303,13 +506,12 @@ def extract_function_from_code(code, function_name):
 
 
 def read_parrot_example(filename):
-    """Read a Parrot example file."""
-    try:
-        with open(filename, "r") as f:
-            return f.read()
-    except Exception as e:
-        print(f"Error reading Parrot example {filename}: {e}")
-        return None
+    """Read a Parrot example file.
+
+    Decoding errors are replaced rather than raised so the fast path is a
+    bare open+read; I/O failures (OSError) are handled at the call sites.
+    """
+    return Path(filename).read_text(encoding="utf-8", errors="replace")
 
 
 def strip_license_header(code):
@@ -320,43 +522,48 @@ def strip_license_header(code):
     if not code:
         return code
 
-    lines = code.split('\n')
-    result_lines = []
+    return strip_license_from_lines(code.split('\n'))
+
+
+def strip_license_from_lines(lines):
+    """Like strip_license_header, for an already-split line list."""
     in_license_block = False
-    found_first_code = False
 
+    # Only the header region needs per-line inspection; everything from the
+    # first line of real code onwards passes through untouched, so return it
+    # as a single slice instead of accumulating line by line.
     for i, line in enumerate(lines):
         stripped = line.strip()
 
         # Check if we're entering a license block comment
-        if not found_first_code and stripped.startswith('/*'):
+        if stripped.startswith('/*'):
             in_license_block = True
             continue
 
-        # Check if we're exiting a license block comment
-        if in_license_block and '*/' in line:
-            in_license_block = False
-            continue
-
-        # Skip lines inside license block
+        # Skip lines inside the license block, watching for its end
         if in_license_block:
+            if '*/' in line:
+                in_license_block = False
             continue
 
         # Skip GitHub URL comments (after license block)
-        if not found_first_code and stripped.startswith('//'):
-            # Check if it's a GitHub URL or "to" line
-            if 'github.com' in stripped or stripped.startswith('// to'):
-                continue
+        if stripped.startswith('//') and ('github.com' in stripped
+                                          or stripped.startswith('// to')):
+            continue
 
         # Skip empty lines at the beginning
-        if not found_first_code and not stripped:
+        if not stripped:
             continue
 
-        # We've found the first line of actual code
-        found_first_code = True
-        result_lines.append(line)
+        # First line of actual code
+        return '\n'.join(lines[i:])
+
+    return ''
 
-    return '\n'.join(result_lines)
+
+# C-style /* */ and // comments, fused into one alternation so stripping is
+# a single linear pass; compiled once rather than per call.
+_COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)
 
 
 def strip_comments_and_count_lines(code):
@@ -364,85 +571,84 @@ def strip_comments_and_count_lines(code):
     if not code:
         return 0
 
-    # Remove C-style comments (both /* */ and // style)
-    code_no_block_comments = re.sub(r"/\*.*?\*/", "", code, flags=re.DOTALL)
-    code_no_comments = re.sub(r"//.*$",
-                              "",
-                              code_no_block_comments,
-                              flags=re.MULTILINE)
+    code_no_comments = _COMMENT_RE.sub("", code)
 
     # Count non-empty lines
-    non_empty_lines = [
-        line.strip() for line in code_no_comments.splitlines() if line.strip()
-    ]
-    return len(non_empty_lines)
+    return sum(1 for line in code_no_comments.splitlines() if line.strip())
+
+
+def _as_code_block(code):
+    """Indent code for an RST code-block in one pass, newline-terminated."""
+    return "".join(f"    {line}\n" for line in code.splitlines())
 
 
 def write_rst_file(examples, output_file, comparison_lib):
     """Write the RST file with the examples."""
     try:
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, "w") as f:
-            f.write(f"Parrot vs {comparison_lib}\n")
-            f.write("=" * (len(f"Parrot vs {comparison_lib}") + 1) + "\n\n")
-            f.write(
-                f"This page provides comparisons between Parrot code and equivalent {comparison_lib} code for common operations. "
-            )
-
-            if comparison_lib == "Thrust":
-                f.write(
-                    "Parrot is built on top of Thrust but provides a more concise and expressive API.\n\n"
-                )
-            else:
-                f.write(
-                    f"This comparison demonstrates how Parrot's API compares to {comparison_lib}'s API.\n\n"
-                )
+        # Accumulate the document and write it once rather than issuing
+        # dozens of small f.write calls per example
+        parts = []
+        parts.append(f"Parrot vs {comparison_lib}\n")
+        parts.append("=" * (len(f"Parrot vs {comparison_lib}") + 1) + "\n\n")
+        parts.append(
+            f"This page provides comparisons between Parrot code and equivalent {comparison_lib} code for common operations. "
+        )
 
-            f.write(".. contents:: Examples\n")
-            f.write("   :local:\n")
-            f.write("   :depth: 1\n\n")
+        if comparison_lib == "Thrust":
+            parts.append(
+                "Parrot is built on top of Thrust but provides a more concise and expressive API.\n\n"
+            )
+        else:
+            parts.append(
+                f"This comparison demonstrates how Parrot's API compares to {comparison_lib}'s API.\n\n"
+            )
 
-            f.write("Examples\n")
-            f.write("--------\n\n")
-            f.write("|\n")
+        parts.append(".. contents:: Examples\n")
+        parts.append("   :local:\n")
+        parts.append("   :depth: 1\n\n")
+
+        parts.append("Examples\n")
+        parts.append("--------\n\n")
+        parts.append("|\n")
+
+        for example in examples:
+            if example["parrot_code"] and example["comparison_code"]:
+                # Create title with completion status
+                status = "✅" if example.get("status") == "complete" else "🟡"
+                title_text = f"{status} {example['title']}"
+
+                # Add code ratio if available
+                if (example.get("code_ratio")
+                        and example.get("status") == "complete"):
+                    title_text += f" ({example['code_ratio']}x less code)"
+
+                parts.append(f"{title_text}\n")
+                parts.append("~" * (len(title_text) + 1) + "\n\n")
+
+                # Write Parrot Code section
+                parts.append("**Parrot Code**\n\n")
+                parts.append(".. code-block:: cpp\n\n")
+                parts.append(_as_code_block(example["parrot_code"]))
+                parts.append("\n")
+
+                # Write Comparison Code section
+                parts.append(f"**{comparison_lib} Code**\n\n")
+                if example.get("status") == "complete":
+                    if comparison_lib == "Thrust":
+                        parts.append(
+                            f"Link: https://github.com/NVIDIA/cccl/blob/main/thrust/examples/{example['comparison_filename']}.cu\n\n"
+                        )
+
+                    parts.append(".. code-block:: cpp\n\n")
+                    parts.append(_as_code_block(example["comparison_code"]))
+                else:
+                    parts.append(".. code-block:: cpp\n\n")
+                    parts.append("    // TODO\n")
+                parts.append("\n")
 
-            for example in examples:
-                if example["parrot_code"] and example["comparison_code"]:
-                    # Create title with completion status
-                    status = "✅" if example.get(
-                        "status") == "complete" else "🟡"
-                    title_text = f"{status} {example['title']}"
-
-                    # Add code ratio if available
-                    if (example.get("code_ratio")
-                            and example.get("status") == "complete"):
-                        title_text += f" ({example['code_ratio']}x less code)"
-
-                    f.write(f"{title_text}\n")
-                    f.write("~" * (len(title_text) + 1) + "\n\n")
-
-                    # Write Parrot Code section
-                    f.write("**Parrot Code**\n\n")
-                    f.write(".. code-block:: cpp\n\n")
-                    for line in example["parrot_code"].splitlines():
-                        f.write(f"    {line}\n")
-                    f.write("\n")
-
-                    # Write Comparison Code section
-                    f.write(f"**{comparison_lib} Code**\n\n")
-                    if example.get("status") == "complete":
-                        if comparison_lib == "Thrust":
-                            f.write(
-                                f"Link: https://github.com/NVIDIA/cccl/blob/main/thrust/examples/{example['comparison_filename']}.cu\n\n"
-                            )
-
-                        f.write(".. code-block:: cpp\n\n")
-                        for line in example["comparison_code"].splitlines():
-                            f.write(f"    {line}\n")
-                    else:
-                        f.write(".. code-block:: cpp\n\n")
-                        f.write("    // TODO\n")
-                    f.write("\n")
+        with open(output_file, "w") as f:
+            f.write("".join(parts))
         return True
     except Exception as e:
         print(f"Error writing RST file: {e}")
@@ -464,6 +670,76 @@ def check_example_status(parrot_code, comparison_code):
     return "complete"
 
 
+def _process_one_parrot_file(parrot_path, parrot_file, raw_url, lib_name,
+                             fetched):
+    """Build one comparison-example entry; returns None if unreadable."""
+    print(f"Processing {parrot_file}...")
+    parrot_basename = os.path.splitext(parrot_file)[0]
+
+    # For simplicity, use the same basename for the comparison example
+    comparison_filename = parrot_basename
+
+    # Generate title from filename
+    title = auto_generate_title(parrot_file)
+
+    # Default to complete unless we find out otherwise
+    status = "complete"
+
+    example = {
+        "title": title,
+        "comparison_filename": comparison_filename,
+        "status": status,
+        "parrot_code": None,
+        "comparison_code": None,
+    }
+
+    # Read Parrot example
+    try:
+        parrot_code = read_parrot_example(parrot_path)
+    except OSError as e:
+        print(f"Warning: Could not read Parrot example '{parrot_path}': {e}")
+        return None
+    if not parrot_code:
+        print(f"Warning: Could not read Parrot example '{parrot_path}'!")
+        return None
+
+    # Strip license header for display
+    example["parrot_code"] = strip_license_header(parrot_code)
+
+    # Comparison example, fetched concurrently up front
+    comparison_code = fetched.get(f"{raw_url}/{comparison_filename}.cu")
+    if not comparison_code:
+        print(
+            f"Warning: Could not fetch {lib_name} example '{comparison_filename}'!"
+        )
+        example["status"] = "incomplete"
+        example["comparison_code"] = "// TODO"
+    else:
+        # Format comparison code with clang-format
+        example["comparison_code"] = format_code_with_clang(comparison_code)
+
+    # Update status based on content
+    if example["parrot_code"] and example["comparison_code"]:
+        example["status"] = check_example_status(example["parrot_code"],
+                                                 example["comparison_code"])
+
+        # Calculate code ratio if both examples are complete
+        if example["status"] == "complete":
+            parrot_lines = strip_comments_and_count_lines(
+                example["parrot_code"])
+            comparison_lines = strip_comments_and_count_lines(
+                example["comparison_code"])
+
+            if parrot_lines > 0 and comparison_lines > 0:
+                ratio = comparison_lines / parrot_lines
+                example["code_ratio"] = round(ratio, 1)
+                print(
+                    f"  Code ratio for {example['title']}: {example['code_ratio']}x"
+                )
+
+    return example
+
+
 def process_examples(parrot_dir, raw_url, api_url, github_repo_url, lib_name):
     """Process examples for a given library comparison."""
     print(f"Processing {lib_name} examples...")
@@ -480,75 +756,25 @@ def process_examples(parrot_dir, raw_url, api_url, github_repo_url, lib_name):
             f"Warning: Could not fetch {lib_name} examples list. Using filenames only..."
         )
 
-    examples = []
-
-    # Discover Parrot examples
-    parrot_files = [f for f in os.listdir(parrot_dir) if f.endswith(".cu")]
-
-    for parrot_file in parrot_files:
-        print(f"Processing {parrot_file}...")
-        parrot_path = os.path.join(parrot_dir, parrot_file)
-        parrot_basename = os.path.splitext(parrot_file)[0]
-
-        # For simplicity, use the same basename for the comparison example
-        comparison_filename = parrot_basename
-
-        # Generate title from filename
-        title = auto_generate_title(parrot_file)
-
-        # Default to complete unless we find out otherwise
-        status = "complete"
-
-        example = {
-            "title": title,
-            "comparison_filename": comparison_filename,
-            "status": status,
-            "parrot_code": None,
-            "comparison_code": None,
-        }
-
-        # Read Parrot example
-        parrot_code = read_parrot_example(parrot_path)
-        if not parrot_code:
-            print(f"Warning: Could not read Parrot example '{parrot_path}'!")
-            continue
-
-        # Strip license header for display
-        example["parrot_code"] = strip_license_header(parrot_code)
-
-        # Fetch comparison example
-        comparison_code = fetch_example_content(raw_url, comparison_filename)
-        if not comparison_code:
-            print(
-                f"Warning: Could not fetch {lib_name} example '{comparison_filename}'!"
-            )
-            example["status"] = "incomplete"
-            example["comparison_code"] = "// TODO"
-        else:
-            # Format comparison code with clang-format
-            example["comparison_code"] = format_code_with_clang(
-                comparison_code)
-
-        # Update status based on content
-        if example["parrot_code"] and example["comparison_code"]:
-            example["status"] = check_example_status(
-                example["parrot_code"], example["comparison_code"])
-
-            # Calculate code ratio if both examples are complete
-            if example["status"] == "complete":
-                parrot_lines = strip_comments_and_count_lines(
-                    example["parrot_code"])
-                comparison_lines = strip_comments_and_count_lines(
-                    example["comparison_code"])
-
-                if parrot_lines > 0 and comparison_lines > 0:
-                    ratio = comparison_lines / parrot_lines
-                    example["code_ratio"] = round(ratio, 1)
-                    print(
-                        f"  Code ratio for {example['title']}: {example['code_ratio']}x"
-                    )
-
-        examples.append(example)
+    # Discover Parrot examples. scandir returns DirEntry objects whose type
+    # and path come from the directory read itself, avoiding a stat per file.
+    with os.scandir(parrot_dir) as it:
+        parrot_files = [e for e in it if e.is_file() and e.name.endswith(".cu")]
+
+    # Fetch every comparison example concurrently up front; per-file
+    # processing below then never waits on the network.
+    fetched = fetch_many(
+        f"{raw_url}/{os.path.splitext(e.name)[0]}.cu" for e in parrot_files)
+
+    # Each file is independent (local read + clang-format subprocess), so
+    # process them on a thread pool; I/O and subprocess waits release the GIL.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        examples = list(
+            executor.map(
+                lambda e: _process_one_parrot_file(e.path, e.name, raw_url,
+                                                   lib_name, fetched),
+                parrot_files))
+    examples = [example for example in examples if example is not None]
 
     # Sort examples alphabetically by title
     examples.sort(key=lambda x: x["title"])
@@ -568,14 +794,15 @@ def process_getting_started_examples(getting_started_dir):
     examples = []
 
     # Discover getting_started examples
-    getting_started_files = [
-        f for f in os.listdir(getting_started_dir) if f.endswith(".cu")
-    ]
+    with os.scandir(getting_started_dir) as it:
+        getting_started_files = [
+            e for e in it if e.is_file() and e.name.endswith(".cu")
+        ]
 
-    for getting_started_file in getting_started_files:
+    for entry in getting_started_files:
+        getting_started_file = entry.name
         print(f"Processing {getting_started_file}...")
-        getting_started_path = os.path.join(getting_started_dir,
-                                            getting_started_file)
+        getting_started_path = entry.path
         getting_started_basename = os.path.splitext(getting_started_file)[0]
 
         # Generate title from filename
@@ -588,7 +815,13 @@ def process_getting_started_examples(getting_started_dir):
         }
 
         # Read getting_started example
-        code = read_parrot_example(getting_started_path)
+        try:
+            code = read_parrot_example(getting_started_path)
+        except OSError as e:
+            print(
+                f"Warning: Could not read getting_started example '{getting_started_path}': {e}"
+            )
+            continue
         if not code:
             print(
                 f"Warning: Could not read getting_started example '{getting_started_path}'!"
@@ -606,6 +839,66 @@ def process_getting_started_examples(getting_started_dir):
     return examples
 
 
+def _assemble_real_world_example(subdir, parrot_code, parrot_lines,
+                                 github_info, fetched):
+    """Build one real-world entry from a prefetched original; None on failure."""
+    original_code = fetched.get(
+        raw_github_url(github_info['owner'], github_info['repo'],
+                       github_info['commit'], github_info['path']))
+
+    if not original_code:
+        print(f"Warning: Could not fetch original code from GitHub!")
+        return None
+
+    # Extract specific line range if specified
+    if github_info['start_line'] and github_info['end_line']:
+        print(
+            f"  Extracting lines {github_info['start_line']} to {github_info['end_line']}"
+        )
+        original_code = extract_lines_from_code(original_code,
+                                                github_info['start_line'],
+                                                github_info['end_line'])
+
+    if not original_code:
+        print(f"Warning: Could not extract lines from original code!")
+        return None
+
+    # Format the original code with clang-format
+    original_code = format_code_with_clang(original_code)
+
+    # Generate title from subdirectory name
+    title = subdir.replace('_', ' ').title()
+
+    # Build the full GitHub URL for the source (with line numbers if available)
+    source_url = github_info['url']
+
+    # Strip license header from Parrot code for display (reusing the line
+    # list split during the plan pass)
+    parrot_code_display = strip_license_from_lines(parrot_lines)
+
+    # Create the example entry
+    example = {
+        "title": title,
+        "subdir": subdir,
+        "original_code": original_code,
+        "parrot_code": parrot_code_display,
+        "source_url": source_url,
+    }
+
+    # Calculate code ratio
+    original_lines = strip_comments_and_count_lines(original_code)
+    parrot_lines = strip_comments_and_count_lines(parrot_code)
+
+    if original_lines > 0 and parrot_lines > 0:
+        ratio = original_lines / parrot_lines
+        example["code_ratio"] = round(ratio, 1)
+        print(
+            f"  Code ratio for {example['title']}: {example['code_ratio']}x reduction"
+        )
+
+    return example
+
+
 def process_real_world_examples(real_world_dir):
     """Process real world examples from real_world directory."""
     print("Processing real world examples...")
@@ -615,35 +908,46 @@ def process_real_world_examples(real_world_dir):
         print(f"Error: Directory '{real_world_dir}' not found!")
         return []
 
-    examples = []
-
-    # Discover subdirectories in real_world
-    subdirs = [
-        d for d in os.listdir(real_world_dir)
-        if os.path.isdir(os.path.join(real_world_dir, d))
-    ]
+    # Discover subdirectories in real_world; DirEntry.is_dir() reuses the
+    # type information from the directory read instead of a stat per entry.
+    with os.scandir(real_world_dir) as it:
+        subdir_entries = [e for e in it if e.is_dir()]
 
-    for subdir in subdirs:
+    # Plan pass: read local Parrot files and collect their GitHub references
+    # so the originals can all be fetched concurrently.
+    planned = []
+    for subdir_entry in subdir_entries:
+        subdir = subdir_entry.name
         print(f"Processing real world example: {subdir}...")
-        subdir_path = os.path.join(real_world_dir, subdir)
 
         # Find all .cu and .h files in the subdirectory (Parrot versions)
-        parrot_files = [
-            f for f in os.listdir(subdir_path)
-            if f.endswith('.cu') or f.endswith('.h')
-        ]
+        with os.scandir(subdir_entry.path) as it:
+            parrot_files = [
+                e for e in it
+                if e.is_file() and e.name.endswith(('.cu', '.h'))
+            ]
 
-        for parrot_file in parrot_files:
-            parrot_path = os.path.join(subdir_path, parrot_file)
+        for parrot_entry in parrot_files:
+            parrot_path = parrot_entry.path
 
             # Read Parrot example
-            parrot_code = read_parrot_example(parrot_path)
+            try:
+                parrot_code = read_parrot_example(parrot_path)
+            except OSError as e:
+                print(
+                    f"Warning: Could not read parrot file '{parrot_path}': {e}"
+                )
+                continue
             if not parrot_code:
                 print(f"Warning: Could not read parrot file '{parrot_path}'!")
                 continue
 
+            # Split once; the assemble pass reuses the same line list when
+            # stripping the license header instead of re-splitting the file.
+            parrot_lines = parrot_code.split('\n')
+
             # Parse GitHub URL from comments
-            github_info = parse_github_url_from_comments(parrot_code)
+            github_info = parse_github_url_from_lines(parrot_lines)
             if not github_info:
                 print(
                     f"Warning: No GitHub URL found in '{parrot_path}'! Skipping."
@@ -651,63 +955,21 @@ def process_real_world_examples(real_world_dir):
                 continue
 
             print(f"  Found GitHub reference: {github_info['url']}")
-
-            # Fetch original code from GitHub using commit hash
-            original_code = fetch_file_from_github(github_info['owner'],
-                                                   github_info['repo'],
-                                                   github_info['commit'],
-                                                   github_info['path'])
-
-            if not original_code:
-                print(f"Warning: Could not fetch original code from GitHub!")
-                continue
-
-            # Extract specific line range if specified
-            if github_info['start_line'] and github_info['end_line']:
-                print(
-                    f"  Extracting lines {github_info['start_line']} to {github_info['end_line']}"
-                )
-                original_code = extract_lines_from_code(
-                    original_code, github_info['start_line'],
-                    github_info['end_line'])
-
-            if not original_code:
-                print(f"Warning: Could not extract lines from original code!")
-                continue
-
-            # Format the original code with clang-format
-            original_code = format_code_with_clang(original_code)
-
-            # Generate title from subdirectory name
-            title = subdir.replace('_', ' ').title()
-
-            # Build the full GitHub URL for the source (with line numbers if available)
-            source_url = github_info['url']
-
-            # Strip license header from Parrot code for display
-            parrot_code_display = strip_license_header(parrot_code)
-
-            # Create the example entry
-            example = {
-                "title": title,
-                "subdir": subdir,
-                "original_code": original_code,
-                "parrot_code": parrot_code_display,
-                "source_url": source_url,
-            }
-
-            # Calculate code ratio
-            original_lines = strip_comments_and_count_lines(original_code)
-            parrot_lines = strip_comments_and_count_lines(parrot_code)
-
-            if original_lines > 0 and parrot_lines > 0:
-                ratio = original_lines / parrot_lines
-                example["code_ratio"] = round(ratio, 1)
-                print(
-                    f"  Code ratio for {example['title']}: {example['code_ratio']}x reduction"
-                )
-
-            examples.append(example)
+            planned.append((subdir, parrot_code, parrot_lines, github_info))
+
+    # Fetch all referenced originals at once (deduplicated by URL)
+    fetched = fetch_many(
+        raw_github_url(gi['owner'], gi['repo'], gi['commit'], gi['path'])
+        for _, _, _, gi in planned)
+
+    # Assemble entries on a thread pool: each one is an independent
+    # line-extraction + clang-format subprocess call.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        examples = list(
+            executor.map(
+                lambda planned_item: _assemble_real_world_example(
+                    *planned_item, fetched), planned))
+    examples = [example for example in examples if example is not None]
 
     # Sort examples alphabetically by title
     examples.sort(key=lambda x: x["title"])
@@ -719,76 +981,77 @@ def write_examples_rst_file(examples, real_world_examples, output_file):
     """Write the examples RST file with standalone Parrot examples and real world examples."""
     try:
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, "w") as f:
-            f.write("Examples\n")
-            f.write("========\n\n")
-            f.write(
-                "This page provides standalone Parrot examples demonstrating common operations and patterns, "
-                "as well as real world examples showing before and after code transformations.\n\n"
-            )
+        # Accumulate the document and write it once (see write_rst_file)
+        parts = []
+        parts.append("Examples\n")
+        parts.append("========\n\n")
+        parts.append(
+            "This page provides standalone Parrot examples demonstrating common operations and patterns, "
+            "as well as real world examples showing before and after code transformations.\n\n"
+        )
 
-            f.write(".. contents:: Examples\n")
-            f.write("   :local:\n")
-            f.write("   :depth: 1\n\n")
+        parts.append(".. contents:: Examples\n")
+        parts.append("   :local:\n")
+        parts.append("   :depth: 1\n\n")
 
-            # Write standalone examples section
-            if examples:
-                f.write("Getting Started Examples\n")
-                f.write("------------------------\n\n")
-                f.write(
-                    "These examples demonstrate basic Parrot functionality and common patterns.\n\n"
-                )
+        # Write standalone examples section
+        if examples:
+            parts.append("Getting Started Examples\n")
+            parts.append("------------------------\n\n")
+            parts.append(
+                "These examples demonstrate basic Parrot functionality and common patterns.\n\n"
+            )
 
-                for example in examples:
-                    if example["code"]:
-                        title_text = example["title"]
-
-                        f.write(f"{title_text}\n")
-                        f.write("~" * len(title_text) + "\n\n")
-
-                        f.write(".. code-block:: cpp\n\n")
-                        for line in example["code"].splitlines():
-                            f.write(f"    {line}\n")
-                        f.write("\n")
-
-            # Write real world examples section
-            if real_world_examples:
-                f.write("Real World Examples\n")
-                f.write("-------------------\n\n")
-                f.write(
-                    "These examples show real world code transformations using Parrot. "
-                    "Each example demonstrates the before and after code, highlighting "
-                    "how Parrot simplifies complex operations.\n\n")
-
-                for example in real_world_examples:
-                    if example["original_code"] and example["parrot_code"]:
-                        # Create title with code reduction ratio
-                        title_text = example["title"]
-                        if example.get("code_ratio"):
-                            title_text += f" ({example['code_ratio']}x code reduction)"
-
-                        f.write(f"{title_text}\n")
-                        f.write("~" * len(title_text) + "\n\n")
-
-                        # Add source URL if available
-                        if example.get("source_url"):
-                            f.write(
-                                f"**Source:** `Original Code <{example['source_url']}>`_\n\n"
-                            )
-
-                        # Write Before (Original) Code section
-                        f.write("**Before (Original)**\n\n")
-                        f.write(".. code-block:: cpp\n\n")
-                        for line in example["original_code"].splitlines():
-                            f.write(f"    {line}\n")
-                        f.write("\n")
-
-                        # Write After (Parrot) Code section
-                        f.write("**After (Parrot)**\n\n")
-                        f.write(".. code-block:: cpp\n\n")
-                        for line in example["parrot_code"].splitlines():
-                            f.write(f"    {line}\n")
-                        f.write("\n")
+            for example in examples:
+                if example["code"]:
+                    title_text = example["title"]
+
+                    parts.append(f"{title_text}\n")
+                    parts.append("~" * len(title_text) + "\n\n")
+
+                    parts.append(".. code-block:: cpp\n\n")
+                    parts.append(_as_code_block(example["code"]))
+                    parts.append("\n")
+
+        # Write real world examples section
+        if real_world_examples:
+            parts.append("Real World Examples\n")
+            parts.append("-------------------\n\n")
+            parts.append(
+                "These examples show real world code transformations using Parrot. "
+                "Each example demonstrates the before and after code, highlighting "
+                "how Parrot simplifies complex operations.\n\n")
+
+            for example in real_world_examples:
+                if example["original_code"] and example["parrot_code"]:
+                    # Create title with code reduction ratio
+                    title_text = example["title"]
+                    if example.get("code_ratio"):
+                        title_text += f" ({example['code_ratio']}x code reduction)"
+
+                    parts.append(f"{title_text}\n")
+                    parts.append("~" * len(title_text) + "\n\n")
+
+                    # Add source URL if available
+                    if example.get("source_url"):
+                        parts.append(
+                            f"**Source:** `Original Code <{example['source_url']}>`_\n\n"
+                        )
+
+                    # Write Before (Original) Code section
+                    parts.append("**Before (Original)**\n\n")
+                    parts.append(".. code-block:: cpp\n\n")
+                    parts.append(_as_code_block(example["original_code"]))
+                    parts.append("\n")
+
+                    # Write After (Parrot) Code section
+                    parts.append("**After (Parrot)**\n\n")
+                    parts.append(".. code-block:: cpp\n\n")
+                    parts.append(_as_code_block(example["parrot_code"]))
+                    parts.append("\n")
+
+        with open(output_file, "w") as f:
+            f.write("".join(parts))
         return True
     except Exception as e:
         print(f"Error writing examples RST file: {e}")
@@ -56,6 +56,16 @@ if ! command -v clang-format &> /dev/null; then
     echo ""
 fi
 
+# Vendor MathJax into _static so built pages don't pull it from a CDN
+MATHJAX_BUNDLE="docs/_static/mathjax/tex-mml-chtml.js"
+MATHJAX_URL="https://cdn.jsdelivr.net/npm/mathjax@3.2.2/es5/tex-mml-chtml.js"
+if [ ! -f "$MATHJAX_BUNDLE" ] && command -v curl &> /dev/null; then
+    echo "Vendoring MathJax into docs/_static/mathjax/..."
+    mkdir -p "$(dirname "$MATHJAX_BUNDLE")"
+    curl -fsSL -o "$MATHJAX_BUNDLE" "$MATHJAX_URL" || \
+        echo "Note: MathJax download failed. Pages will fall back to the CDN."
+fi
+
 # Generate comparison documentation (unless quick)
 if [ "$QUICK" -eq 1 ]; then
     echo "Skipping example/comparison generation (--quick)."
@@ -68,10 +78,10 @@ fi
 if command -v uv &> /dev/null; then
     echo "Building Sphinx documentation..."
     cd docs
-    uv run make html
-    echo "Documentation built successfully in docs/_build/html/"
+    uv run make dirhtml
+    echo "Documentation built successfully in docs/build/dirhtml/"
 else
-    echo "uv not found. Please install uv or run: pip install -r requirements.txt && cd docs && make html"
+    echo "uv not found. Please install uv or run: pip install -r requirements.txt && cd docs && make dirhtml"
     echo "Documentation comparison files generated successfully."
 fi
 